@@ -32,9 +32,13 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.1",
-        "backoff>=2.2.1",
+        "requests-toolbelt>=1.0.0",
         "tqdm>=4.66.1",
     ],
+    extras_require={
+        "orjson": ["orjson>=3.8"],
+        "async": ["httpx[http2]>=0.24"],
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
@@ -0,0 +1,212 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from videodb._utils import _async_http_client
+from videodb._utils._async_http_client import AsyncHttpClient
+from videodb.client import Connection
+from videodb.exceptions import (
+    AuthenticationError,
+    InvalidRequestError,
+    RequestTimeoutError,
+)
+from videodb.video import Video
+
+
+async def no_sleep(delay):
+    pass
+
+
+def mock_client(monkeypatch, handler, max_retries=1):
+    monkeypatch.setattr(_async_http_client.asyncio, "sleep", no_sleep)
+    client = AsyncHttpClient(
+        api_key="key", base_url="https://api", version="0.0.0", max_retries=max_retries
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def success(data):
+    return httpx.Response(200, json={"success": True, "data": data})
+
+
+def test_retries_status_forcelist(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return success({"id": "m-1"})
+
+    client = mock_client(monkeypatch, handler)
+
+    assert asyncio.run(client.get("video/m-1")) == {"id": "m-1"}
+    assert len(calls) == 2
+
+
+def test_does_not_resend_post_on_status_forcelist(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return success({"scene_index_id": "si-1"})
+
+    client = mock_client(monkeypatch, handler)
+
+    with pytest.raises(InvalidRequestError):
+        asyncio.run(client.post("video/m-1/index/scene", data={}))
+    assert calls == ["POST"]
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    client = mock_client(monkeypatch, handler, max_retries=2)
+
+    with pytest.raises(InvalidRequestError, match="unavailable"):
+        asyncio.run(client.get("video/m-1"))
+    assert len(calls) == 3
+
+
+def test_max_retries_none_makes_a_single_attempt(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = mock_client(monkeypatch, handler, max_retries=None)
+
+    with pytest.raises(InvalidRequestError):
+        asyncio.run(client.get("video/m-1"))
+    assert len(calls) == 1
+
+
+def test_maps_authentication_error(monkeypatch):
+    client = mock_client(
+        monkeypatch, lambda request: httpx.Response(401, json={"message": "bad key"})
+    )
+
+    with pytest.raises(AuthenticationError, match="bad key"):
+        asyncio.run(client.get("video/m-1"))
+
+
+def test_maps_timeout_and_connection_errors(monkeypatch):
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    def refused(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    with pytest.raises(RequestTimeoutError):
+        asyncio.run(mock_client(monkeypatch, timeout).get("video/m-1"))
+    with pytest.raises(InvalidRequestError, match="Connection error"):
+        asyncio.run(mock_client(monkeypatch, refused).get("video/m-1"))
+
+
+def test_drops_none_params_and_encodes_body(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return success(None)
+
+    client = mock_client(monkeypatch, handler)
+    asyncio.run(client.get("video", params={"start": None, "end": 10}))
+    asyncio.run(client.post("video", data={"name": "video"}))
+
+    assert dict(requests[0].url.params) == {"end": "10"}
+    assert json.loads(requests[1].content) == {"name": "video"}
+
+
+def test_polls_sync_processing_output(monkeypatch):
+    outputs = iter(
+        [
+            {"status": "processing"},
+            {"status": "done", "response": {"success": True, "data": "done"}},
+        ]
+    )
+
+    def handler(request):
+        if request.url.path == "/output":
+            return httpx.Response(200, json=next(outputs))
+        return httpx.Response(
+            200,
+            json={
+                "status": "processing",
+                "request_type": "sync",
+                "data": {"output_url": "https://api/output"},
+            },
+        )
+
+    client = mock_client(monkeypatch, handler)
+
+    assert asyncio.run(client.get("video/m-1/transcription")) == "done"
+
+
+class StubConnection:
+    def __init__(self, async_client):
+        self.async_client = async_client
+
+
+def test_video_async_methods(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/transcription"):
+            return success({"word_timestamps": [{"text": "hi"}], "text": "hi"})
+        if request.url.path.endswith("/scenes"):
+            return success(
+                {
+                    "scene_collection": {
+                        "scene_collection_id": "sc-1",
+                        "scenes": [{"scene_id": "s-1", "start": 0, "end": 1}],
+                    }
+                }
+            )
+        return success({"scene_index_id": "si-1"})
+
+    video = Video(StubConnection(mock_client(monkeypatch, handler)), "m-1", "c-1")
+
+    async def run():
+        return await asyncio.gather(
+            video.get_transcript_text_async(),
+            video.extract_scenes_async(),
+            video.index_scenes_async(),
+        )
+
+    text, scene_collection, scene_index_id = asyncio.run(run())
+    assert text == "hi"
+    assert video.transcript == [{"text": "hi"}]
+    assert scene_collection.id == "sc-1"
+    assert scene_collection.scenes[0].id == "s-1"
+    assert scene_index_id == "si-1"
+
+
+def test_connection_async_client_per_event_loop():
+    connection = Connection(api_key="key", base_url="https://api")
+
+    async def get_client():
+        client = connection.async_client
+        assert connection.async_client is client
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+    async def close():
+        client = connection.async_client
+        await connection.aclose()
+        return client
+
+    closed = asyncio.run(close())
+    assert closed.client.is_closed
+    assert connection._async_client is None
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from videodb._constants import HttpClientDefaultValues
+from videodb._utils import _http_client
+from videodb._utils._http_client import HttpClient
+from videodb.exceptions import RequestTimeoutError
+
+
+class StubResponse:
+    def __init__(self, body):
+        self.content = body if isinstance(body, bytes) else json.dumps(body).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class StubProgressBar:
+    def __init__(self):
+        self.n = 0
+        self.closed = False
+
+    def update(self, n):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = HttpClient(api_key="key", base_url="https://api", version="0.0.0")
+    sleeps = []
+    monkeypatch.setattr(_http_client.time, "sleep", sleeps.append)
+    client.sleeps = sleeps
+    return client
+
+
+def stub_outputs(monkeypatch, client, bodies):
+    responses = iter(StubResponse(body) for body in bodies)
+    monkeypatch.setattr(client.session, "get", lambda url, timeout: next(responses))
+
+
+def test_get_output_waits_until_done(monkeypatch, client):
+    stub_outputs(
+        monkeypatch,
+        client,
+        [
+            {"status": "processing", "data": {"percentage": 50}},
+            {"status": "in progress"},
+            {"status": "done", "response": {"success": True, "data": "output"}},
+        ],
+    )
+
+    assert client._get_output("https://output") == {"success": True, "data": "output"}
+    assert len(client.sleeps) == 2
+    assert client.sleeps[0] < client.sleeps[1]
+    assert all(
+        delay
+        <= HttpClientDefaultValues.poll_max_interval
+        + HttpClientDefaultValues.poll_jitter
+        for delay in client.sleeps
+    )
+
+
+def test_get_output_retries_decode_error(monkeypatch, client):
+    stub_outputs(monkeypatch, client, [b"<html>bad gateway</html>", {"success": True}])
+
+    assert client._get_output("https://output") == {"success": True}
+    assert len(client.sleeps) == 1
+
+
+def test_get_output_times_out(monkeypatch, client):
+    monkeypatch.setattr(HttpClientDefaultValues, "poll_max_time", 0)
+    stub_outputs(monkeypatch, client, [{"status": "processing"}])
+    progress_bar = StubProgressBar()
+    client.show_progress = True
+    client.progress_bar = progress_bar
+
+    with pytest.raises(RequestTimeoutError):
+        client._get_output("https://output")
+
+    assert progress_bar.closed
+    assert client.progress_bar is None
+    assert client.show_progress is False
+    assert client.sleeps == []
@@ -0,0 +1,159 @@
+import time
+
+import pytest
+
+from requests import HTTPError
+
+from videodb._constants import UploadDefaultValues
+from videodb._upload import upload
+from videodb.exceptions import VideodbError
+
+
+class StubResponse:
+    def __init__(self, etag=None, error=False):
+        self.headers = {"ETag": etag}
+        self.error = error
+
+    def raise_for_status(self):
+        if self.error:
+            raise HTTPError("Upload failed")
+
+
+class StubSession:
+    def __init__(self, fail_part=None, part_delay=0):
+        self.fail_part = fail_part
+        self.part_delay = part_delay
+        self.parts = {}
+        self.posts = []
+
+    def put(self, url, data, headers, timeout):
+        self.parts[url] = bytes(data)
+        if url == self.fail_part:
+            return StubResponse(error=True)
+        time.sleep(self.part_delay)
+        return StubResponse(etag=f"etag-{url}")
+
+    def post(self, url, data, headers):
+        self.posts.append((url, data.to_string()))
+        return StubResponse()
+
+
+class StubConnection:
+    collection_id = "default"
+
+    def __init__(self, upload_url_data, session=None):
+        self.upload_url_data = upload_url_data
+        self.session = session or StubSession()
+        self.gets = []
+        self.posts = []
+
+    def get(self, path, params):
+        self.gets.append((path, params))
+        return self.upload_url_data
+
+    def post(self, path, data):
+        self.posts.append((path, data))
+        if path.endswith("upload_url/complete"):
+            return {"upload_url": "https://storage/complete"}
+        return {"id": "m-1"}
+
+
+@pytest.fixture
+def multipart(monkeypatch):
+    monkeypatch.setattr(UploadDefaultValues, "multipart_threshold", 50)
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(bytes(range(100)))
+    return str(path)
+
+
+def test_upload_multipart(multipart, video_file):
+    connection = StubConnection(
+        {"part_urls": ["p1", "p2", "p3", "p4"], "upload_id": "u-1"}
+    )
+
+    upload_data = upload(connection, file_path=video_file, chunk_size=30)
+
+    assert upload_data == {"id": "m-1"}
+    session = connection.session
+    assert b"".join(session.parts[url] for url in ["p1", "p2", "p3", "p4"]) == bytes(
+        range(100)
+    )
+    complete_path, complete_data = connection.posts[0]
+    assert complete_path == "collection/default/upload_url/complete"
+    assert complete_data == {
+        "upload_id": "u-1",
+        "parts": [
+            {"part_number": 1, "etag": "etag-p1"},
+            {"part_number": 2, "etag": "etag-p2"},
+            {"part_number": 3, "etag": "etag-p3"},
+            {"part_number": 4, "etag": "etag-p4"},
+        ],
+    }
+    assert connection.posts[1][1]["url"] == "https://storage/complete"
+
+
+def test_upload_single_shot_without_part_urls(video_file):
+    connection = StubConnection({"upload_url": "https://storage/single"})
+
+    upload(connection, file_path=video_file, chunk_size=30)
+
+    session = connection.session
+    assert session.parts == {}
+    assert session.posts[0][0] == "https://storage/single"
+    assert bytes(range(100)) in session.posts[0][1]
+    assert connection.posts[0][1]["url"] == "https://storage/single"
+
+
+def test_upload_small_file_ignores_part_urls(video_file):
+    connection = StubConnection(
+        {"upload_url": "https://storage/single", "part_urls": ["p1"]}
+    )
+
+    upload(connection, file_path=video_file, chunk_size=30)
+
+    assert "part_count" not in connection.gets[0][1]
+    assert connection.session.parts == {}
+    assert connection.session.posts[0][0] == "https://storage/single"
+
+
+def test_upload_part_count_mismatch(multipart, video_file):
+    connection = StubConnection({"part_urls": ["p1", "p2"], "upload_id": "u-1"})
+
+    with pytest.raises(VideodbError):
+        upload(connection, file_path=video_file, chunk_size=30)
+
+    assert connection.session.parts == {}
+    assert connection.posts == [
+        ("collection/default/upload_url/abort", {"upload_id": "u-1"})
+    ]
+
+
+@pytest.mark.parametrize("argument", ["chunk_size", "parallelism"])
+def test_upload_rejects_non_positive_tuning(video_file, argument):
+    connection = StubConnection({"upload_url": "https://storage/single"})
+
+    with pytest.raises(VideodbError):
+        upload(connection, file_path=video_file, **{argument: 0})
+
+    assert connection.gets == []
+
+
+def test_upload_failing_part(multipart, video_file):
+    connection = StubConnection(
+        {"part_urls": ["p1", "p2", "p3", "p4"], "upload_id": "u-1"},
+        session=StubSession(fail_part="p1", part_delay=0.2),
+    )
+
+    with pytest.raises(VideodbError) as e:
+        upload(connection, file_path=video_file, chunk_size=30, parallelism=1)
+
+    assert isinstance(e.value.cause, HTTPError)
+    assert "p3" not in connection.session.parts
+    assert "p4" not in connection.session.parts
+    assert connection.posts == [
+        ("collection/default/upload_url/abort", {"upload_id": "u-1"})
+    ]
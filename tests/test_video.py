@@ -0,0 +1,49 @@
+import pytest
+
+from videodb.video import Video
+
+
+def test_video_getitem_returns_data_attributes():
+    video = Video(None, "m-1", "c-1", name="video")
+
+    assert video["id"] == "m-1"
+    assert video["name"] == "video"
+
+
+def test_video_getitem_rejects_methods_and_unknown_keys():
+    video = Video(None, "m-1", "c-1")
+
+    with pytest.raises(KeyError):
+        video["delete"]
+    with pytest.raises(KeyError):
+        video["unknown"]
+
+
+class StubConnection:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, path, params, show_progress):
+        self.calls.append(params)
+        text = "excerpt" if params["start"] else "full transcript"
+        return {"word_timestamps": [], "text": text}
+
+
+def test_get_transcript_text_uses_loaded_full_text():
+    connection = StubConnection()
+    video = Video(connection, "m-1", "c-1", transcript_text="full transcript")
+
+    assert video.get_transcript_text() == "full transcript"
+    assert connection.calls == []
+
+
+def test_get_transcript_text_refetches_after_ranged_fetch():
+    connection = StubConnection()
+    video = Video(connection, "m-1", "c-1")
+
+    video.get_transcript(start=10, end=20)
+    assert video.get_transcript_text() == "full transcript"
+    assert len(connection.calls) == 2
+
+    assert video.get_transcript_text() == "full transcript"
+    assert len(connection.calls) == 2
@@ -72,6 +72,8 @@ class ApiPath:
     download = "download"
     title = "title"
     generate_url = "generate_url"
+    complete = "complete"
+    abort = "abort"
 
 
 class Status:
@@ -84,6 +86,18 @@ class HttpClientDefaultValues:
     timeout = 30
     backoff_factor = 0.1
     status_forcelist = [502, 503, 504]
+    pool_connections = 32
+    pool_maxsize = 64
+    poll_interval = 0.5
+    poll_max_interval = 5
+    poll_jitter = 0.25
+    poll_max_time = 500
+
+
+class UploadDefaultValues:
+    chunk_size = 16 * 1024 * 1024
+    parallelism = 4
+    multipart_threshold = 100 * 1024 * 1024
 
 
 class MaxSupported:
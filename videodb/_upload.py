@@ -1,17 +1,85 @@
-import requests
+import logging
+import math
+import mmap
+import os
 
-from typing import Optional
-from requests import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from requests import RequestException
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 
 
 from videodb._constants import (
     ApiPath,
+    HttpClientDefaultValues,
+    UploadDefaultValues,
 )
 
 from videodb.exceptions import (
     VideodbError,
 )
 
+logger = logging.getLogger(__name__)
+
+# presigned urls must not receive the json content type or the api key
+# that are set on the connection session
+_PRESIGNED_HEADERS = {"Content-Type": None, "x-access-token": None}
+
+
+def _upload_part(_connection, part_url: str, mm: mmap.mmap, start: int, end: int):
+    with memoryview(mm)[start:end] as chunk:
+        response = _connection.session.put(
+            part_url,
+            data=chunk,
+            headers=_PRESIGNED_HEADERS,
+            timeout=HttpClientDefaultValues.timeout,
+        )
+    response.raise_for_status()
+    return response.headers.get("ETag")
+
+
+def _upload_parts(
+    _connection,
+    file_path: str,
+    file_size: int,
+    part_urls: List[str],
+    chunk_size: int,
+    parallelism: int,
+) -> List[dict]:
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = [
+                    executor.submit(
+                        _upload_part,
+                        _connection,
+                        part_url,
+                        mm,
+                        index * chunk_size,
+                        min((index + 1) * chunk_size, file_size),
+                    )
+                    for index, part_url in enumerate(part_urls)
+                ]
+                try:
+                    return [
+                        {"part_number": index + 1, "etag": future.result()}
+                        for index, future in enumerate(futures)
+                    ]
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+
+def _abort_upload(_connection, upload_id: str) -> None:
+    try:
+        _connection.post(
+            path=f"{ApiPath.collection}/{_connection.collection_id}/{ApiPath.upload_url}/{ApiPath.abort}",
+            data={"upload_id": upload_id},
+        )
+    except VideodbError as e:
+        logger.debug(f"Failed to abort multipart upload {upload_id}: {e}")
+
 
 def upload(
     _connection,
@@ -21,30 +89,82 @@ def upload(
     name: Optional[str] = None,
     description: Optional[str] = None,
     callback_url: Optional[str] = None,
+    chunk_size: int = UploadDefaultValues.chunk_size,
+    parallelism: int = UploadDefaultValues.parallelism,
 ) -> dict:
     if not file_path and not url:
         raise VideodbError("Either file_path or url is required")
     if file_path and url:
         raise VideodbError("Only one of file_path or url is allowed")
+    if chunk_size <= 0:
+        raise VideodbError("chunk_size must be a positive number of bytes")
+    if parallelism <= 0:
+        raise VideodbError("parallelism must be a positive number of parts")
 
     if file_path:
         try:
             name = file_path.split("/")[-1].split(".")[0] if not name else name
+            file_size = os.path.getsize(file_path)
+            part_count = None
+            params = {"name": name}
+            if file_size > UploadDefaultValues.multipart_threshold:
+                part_count = math.ceil(file_size / chunk_size)
+                params["part_count"] = part_count
             upload_url_data = _connection.get(
                 path=f"{ApiPath.collection}/{_connection.collection_id}/{ApiPath.upload_url}",
-                params={"name": name},
+                params=params,
             )
-            upload_url = upload_url_data.get("upload_url")
-            with open(file_path, "rb") as file:
-                files = {"file": (name, file)}
-                response = requests.post(upload_url, files=files)
-                response.raise_for_status()
-                url = upload_url
+            part_urls = upload_url_data.get("part_urls")
+            if part_count and part_urls:
+                upload_id = upload_url_data.get("upload_id")
+                if len(part_urls) != part_count:
+                    _abort_upload(_connection, upload_id)
+                    raise VideodbError(
+                        f"Expected {part_count} part urls for upload, got {len(part_urls)}"
+                    )
+                try:
+                    parts = _upload_parts(
+                        _connection,
+                        file_path,
+                        file_size,
+                        part_urls,
+                        chunk_size,
+                        parallelism,
+                    )
+                except RequestException:
+                    _abort_upload(_connection, upload_id)
+                    raise
+                complete_data = _connection.post(
+                    path=f"{ApiPath.collection}/{_connection.collection_id}/{ApiPath.upload_url}/{ApiPath.complete}",
+                    data={
+                        "upload_id": upload_id,
+                        "parts": parts,
+                    },
+                )
+                url = complete_data.get("upload_url")
+            else:
+                upload_url = upload_url_data.get("upload_url")
+                with open(file_path, "rb") as file:
+                    encoder = MultipartEncoder(
+                        fields={
+                            "file": (name, file, "application/octet-stream"),
+                        }
+                    )
+                    response = _connection.session.post(
+                        upload_url,
+                        data=encoder,
+                        headers={
+                            **_PRESIGNED_HEADERS,
+                            "Content-Type": encoder.content_type,
+                        },
+                    )
+                    response.raise_for_status()
+                    url = upload_url
 
         except FileNotFoundError as e:
             raise VideodbError("File not found", cause=e)
 
-        except HTTPError as e:
+        except RequestException as e:
             raise VideodbError("Error while uploading file", cause=e)
 
     upload_data = _connection.post(
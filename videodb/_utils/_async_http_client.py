@@ -0,0 +1,210 @@
+"""Async http client Module."""
+
+import asyncio
+import importlib.util
+import logging
+import time
+
+from typing import Optional
+from requests.packages.urllib3.util.retry import Retry
+
+from videodb._constants import (
+    HttpClientDefaultValues,
+    Status,
+)
+from videodb.exceptions import (
+    InvalidRequestError,
+    RequestTimeoutError,
+)
+from videodb._utils._http_client import (
+    _decode_json,
+    _encode_json,
+    _poll_delay,
+    _raise_status_error,
+    _response_data,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AsyncHttpClient:
+    """Async http client for making concurrent requests"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        version: str,
+        max_retries: Optional[int] = HttpClientDefaultValues.max_retries,
+    ) -> None:
+        """Create a new async http client instance
+
+        :param str api_key: The api key to use for authentication
+        :param str base_url: The base url to use for the api
+        :param int max_retries: (optional) The maximum number of retries to make for a request
+        :raise ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for async requests, "
+                "install it with `pip install videodb[async]`"
+            )
+        self.version = version
+        self.max_retries = max_retries or 0
+        self.client = httpx.AsyncClient(
+            headers={
+                "x-access-token": api_key,
+                "x-videodb-client": f"videodb-python/{self.version}",
+                "Content-Type": "application/json",
+            },
+            timeout=HttpClientDefaultValues.timeout,
+            transport=httpx.AsyncHTTPTransport(
+                retries=self.max_retries,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=HttpClientDefaultValues.pool_connections,
+                    max_connections=HttpClientDefaultValues.pool_maxsize,
+                ),
+            ),
+        )
+        self.base_url = base_url
+        logger.debug(f"Initialized async http client with base url: {self.base_url}")
+
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        base_url: Optional[str] = None,
+        params: Optional[dict] = None,
+        **kwargs,
+    ):
+        """Make a request to the api
+
+        :param str method: The http method to use for the request
+        :param str path: The path to make the request to
+        :param str base_url: (optional) The base url to use for the request
+        :param dict params: (optional) The query parameters, ``None`` values are dropped
+        :param kwargs: The keyword arguments to pass to the request method
+        :return: json response from the request
+        """
+        url = f"{base_url or self.base_url}/{path}"
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        # match the sync client's urllib3 Retry, which never resends POST/PATCH
+        max_retries = self.max_retries if method in Retry.DEFAULT_ALLOWED_METHODS else 0
+        try:
+            for attempt in range(max_retries + 1):
+                response = await self.client.request(
+                    method, url, params=params, **kwargs
+                )
+                if (
+                    response.status_code not in HttpClientDefaultValues.status_forcelist
+                    or attempt == max_retries
+                ):
+                    break
+                await asyncio.sleep(HttpClientDefaultValues.backoff_factor * 2**attempt)
+            response.raise_for_status()
+            return await self._parse_response(response)
+
+        except httpx.HTTPError as e:
+            self._handle_request_error(e)
+
+    def _handle_request_error(self, e: "httpx.HTTPError") -> None:
+        """Handle request errors"""
+        if isinstance(e, httpx.HTTPStatusError):
+            _raise_status_error(
+                e.response.status_code, e.response.content or b"", e.response
+            )
+
+        elif isinstance(e, httpx.TimeoutException):
+            raise RequestTimeoutError("Timeout error: Request timed out") from None
+
+        elif isinstance(e, httpx.TransportError):
+            raise InvalidRequestError("Invalid request: Connection error") from None
+
+        else:
+            raise InvalidRequestError(f"Invalid request: {str(e)}") from None
+
+    async def _get_output(self, url: str):
+        """Get the output from an async request"""
+        deadline = time.monotonic() + HttpClientDefaultValues.poll_max_time
+        attempt = 0
+        while True:
+            try:
+                response_json = _decode_json(await self.client.get(url))
+            except (httpx.HTTPError, ValueError):
+                logger.debug("Failed to fetch output, retrying")
+                response_json = None
+
+            if response_json is not None and response_json.get("status") not in (
+                Status.in_progress,
+                Status.processing,
+            ):
+                return response_json.get("response") or response_json
+
+            logger.debug("Waiting for processing to complete")
+            if time.monotonic() >= deadline:
+                raise RequestTimeoutError(
+                    "Timeout error: Request timed out waiting for output"
+                ) from None
+
+            await asyncio.sleep(_poll_delay(attempt))
+            attempt += 1
+
+    async def _parse_response(self, response: "httpx.Response"):
+        """Parse the response from the api"""
+        try:
+            response_json = _decode_json(response)
+            status = response_json.get("status")
+            request_type = response_json.get("request_type", "sync")
+            if status == Status.processing and request_type == "async":
+                return None
+
+            if status == Status.processing and request_type == "sync":
+                response_json = await self._get_output(
+                    response_json.get("data", {}).get("output_url")
+                )
+
+            return _response_data(response_json, response)
+
+        except ValueError:
+            raise InvalidRequestError(
+                f"Invalid request: {response.text}", response
+            ) from None
+
+    async def get(self, path: str, **kwargs):
+        """Make a get request"""
+        return await self._make_request("GET", path, **kwargs)
+
+    async def post(self, path: str, data=None, **kwargs):
+        """Make a post request"""
+        return await self._make_request(
+            "POST", path, **_encode_json(data, "content"), **kwargs
+        )
+
+    async def put(self, path: str, data=None, **kwargs):
+        """Make a put request"""
+        return await self._make_request(
+            "PUT", path, **_encode_json(data, "content"), **kwargs
+        )
+
+    async def delete(self, path: str, **kwargs):
+        """Make a delete request"""
+        return await self._make_request("DELETE", path, **kwargs)
+
+    async def patch(self, path: str, data=None, **kwargs):
+        """Make a patch request"""
+        return await self._make_request(
+            "PATCH", path, **_encode_json(data, "content"), **kwargs
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self.client.aclose()
@@ -1,8 +1,12 @@
 """Http client Module."""
 
+import json
 import logging
+import random
+import socket
+import time
+
 import requests
-import backoff
 
 from tqdm import tqdm
 from typing import (
@@ -10,6 +14,7 @@ from typing import (
     Optional,
 )
 from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connection import HTTPConnection
 from requests.packages.urllib3.util.retry import Retry
 
 from videodb._constants import (
@@ -22,9 +27,80 @@ from videodb.exceptions import (
     RequestTimeoutError,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _poll_delay(attempt: int) -> float:
+    """Capped, jittered delay before the next output poll"""
+    return (
+        min(
+            HttpClientDefaultValues.poll_max_interval,
+            HttpClientDefaultValues.poll_interval * 2**attempt,
+        )
+        + random.random() * HttpClientDefaultValues.poll_jitter
+    )
+
+
+def _error_message(body: bytes) -> str:
+    """Extract the error message from an error response body"""
+    try:
+        return json.loads(body).get("message", "Unknown error")
+    except ValueError:
+        return body.decode("utf-8", "replace")
+
+
+def _raise_status_error(status_code: int, body: bytes, response) -> None:
+    """Raise the videodb error for an http error response"""
+    error_message = _error_message(body)
+    if status_code == 401:
+        raise AuthenticationError(f"Error: {error_message}", response) from None
+    raise InvalidRequestError(f"Invalid request: {error_message}", response) from None
+
+
+def _encode_json(data, raw_key: str) -> dict:
+    """Request kwargs for a json body, encoded with orjson when it is installed
+
+    :param data: The json serializable body, ``None`` for no body
+    :param str raw_key: The request kwarg that takes pre-encoded bytes
+    """
+    if data is None:
+        return {}
+    if orjson is None:
+        return {"json": data}
+    return {raw_key: orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)}
+
+
+def _decode_json(response):
+    """Decode the json body of a response with orjson when it is installed"""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _response_data(response_json: dict, response):
+    """Return the data of a finished response or raise its error message"""
+    if response_json.get("success"):
+        return response_json.get("data")
+    raise InvalidRequestError(
+        f"Invalid request: {response_json.get('message')}", response
+    ) from None
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive on top of urllib3's TCP_NODELAY"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        return super().init_poolmanager(*args, **kwargs)
+
+
 class HttpClient:
     """Http client for making requests"""
 
@@ -48,7 +124,11 @@ class HttpClient:
             backoff_factor=HttpClientDefaultValues.backoff_factor,
             status_forcelist=HttpClientDefaultValues.status_forcelist,
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = KeepAliveAdapter(
+            max_retries=retries,
+            pool_connections=HttpClientDefaultValues.pool_connections,
+            pool_maxsize=HttpClientDefaultValues.pool_maxsize,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         self.version = version
@@ -84,8 +164,9 @@ class HttpClient:
         try:
             url = f"{base_url or self.base_url}/{path}"
             timeout = kwargs.pop("timeout", HttpClientDefaultValues.timeout)
-            request_headers = {**self.session.headers, **(headers or {})}
-            response = method(url, headers=request_headers, timeout=timeout, **kwargs)
+            if headers:
+                kwargs["headers"] = headers
+            response = method(url, timeout=timeout, **kwargs)
             response.raise_for_status()
             return self._parse_response(response)
 
@@ -96,19 +177,9 @@ class HttpClient:
         """Handle request errors"""
         self.show_progress = False
         if isinstance(e, requests.exceptions.HTTPError):
-            try:
-                error_message = e.response.json().get("message", "Unknown error")
-            except ValueError:
-                error_message = e.response.text
-
-            if e.response.status_code == 401:
-                raise AuthenticationError(
-                    f"Error: {error_message}", e.response
-                ) from None
-            else:
-                raise InvalidRequestError(
-                    f"Invalid request: {error_message}", e.response
-                ) from None
+            _raise_status_error(
+                e.response.status_code, e.response.content or b"", e.response
+            )
 
         elif isinstance(e, requests.exceptions.RetryError):
             raise InvalidRequestError(
@@ -130,23 +201,44 @@ class HttpClient:
                 f"Invalid request: {str(e)}", e.response
             ) from None
 
-    @backoff.on_exception(
-        backoff.constant, Exception, max_time=500, interval=5, logger=None, jitter=None
-    )
     def _get_output(self, url: str):
         """Get the output from an async request"""
-        response_json = self.session.get(url).json()
-        if (
-            response_json.get("status") == Status.in_progress
-            or response_json.get("status") == Status.processing
-        ):
-            percentage = response_json.get("data", {}).get("percentage")
-            if percentage and self.show_progress and self.progress_bar:
-                self.progress_bar.n = int(percentage)
-                self.progress_bar.update(0)
-
-            logger.debug("Waiting for processing to complete")
-            raise Exception("Stuck on processing status") from None
+        deadline = time.monotonic() + HttpClientDefaultValues.poll_max_time
+        attempt = 0
+        while True:
+            try:
+                response_json = _decode_json(
+                    self.session.get(url, timeout=HttpClientDefaultValues.timeout)
+                )
+            except (requests.exceptions.RequestException, ValueError):
+                logger.debug("Failed to fetch output, retrying")
+                response_json = None
+
+            if response_json is not None and response_json.get("status") not in (
+                Status.in_progress,
+                Status.processing,
+            ):
+                break
+
+            if response_json is not None:
+                percentage = response_json.get("data", {}).get("percentage")
+                if percentage and self.show_progress and self.progress_bar:
+                    self.progress_bar.n = int(percentage)
+                    self.progress_bar.update(0)
+                logger.debug("Waiting for processing to complete")
+
+            if time.monotonic() >= deadline:
+                if self.progress_bar:
+                    self.progress_bar.close()
+                    self.progress_bar = None
+                self.show_progress = False
+                raise RequestTimeoutError(
+                    "Timeout error: Request timed out waiting for output"
+                ) from None
+
+            time.sleep(_poll_delay(attempt))
+            attempt += 1
+
         if self.show_progress and self.progress_bar:
             self.progress_bar.n = 100
             self.progress_bar.update(0)
@@ -158,16 +250,13 @@ class HttpClient:
     def _parse_response(self, response: requests.Response):
         """Parse the response from the api"""
         try:
-            response_json = response.json()
-            if (
-                response_json.get("status") == Status.processing
-                and response_json.get("request_type", "sync") == "async"
-            ):
+            response_json = _decode_json(response)
+            status = response_json.get("status")
+            request_type = response_json.get("request_type", "sync")
+            if status == Status.processing and request_type == "async":
                 return None
-            elif (
-                response_json.get("status") == Status.processing
-                and response_json.get("request_type", "sync") == "sync"
-            ):
+
+            if status == Status.processing and request_type == "sync":
                 if self.show_progress:
                     self.progress_bar = tqdm(
                         total=100,
@@ -178,20 +267,8 @@ class HttpClient:
                 response_json = self._get_output(
                     response_json.get("data", {}).get("output_url")
                 )
-                if response_json.get("success"):
-                    return response_json.get("data")
-                else:
-                    raise InvalidRequestError(
-                        f"Invalid request: {response_json.get('message')}", response
-                    ) from None
-
-            elif response_json.get("success"):
-                return response_json.get("data")
-
-            else:
-                raise InvalidRequestError(
-                    f"Invalid request: {response_json.get('message')}", response
-                ) from None
+
+            return _response_data(response_json, response)
 
         except ValueError:
             raise InvalidRequestError(
@@ -210,11 +287,15 @@ class HttpClient:
     ) -> requests.Response:
         """Make a post request"""
         self.show_progress = show_progress
-        return self._make_request(self.session.post, path, json=data, **kwargs)
+        return self._make_request(
+            self.session.post, path, **_encode_json(data, "data"), **kwargs
+        )
 
     def put(self, path: str, data=None, **kwargs) -> requests.Response:
         """Make a put request"""
-        return self._make_request(self.session.put, path, json=data, **kwargs)
+        return self._make_request(
+            self.session.put, path, **_encode_json(data, "data"), **kwargs
+        )
 
     def delete(self, path: str, **kwargs) -> requests.Response:
         """Make a delete request"""
@@ -222,4 +303,6 @@ class HttpClient:
 
     def patch(self, path: str, data=None, **kwargs) -> requests.Response:
         """Make a patch request"""
-        return self._make_request(self.session.patch, path, json=data, **kwargs)
+        return self._make_request(
+            self.session.patch, path, **_encode_json(data, "data"), **kwargs
+        )
@@ -1,4 +1,3 @@
-import copy
 import logging
 import uuid
 
@@ -41,7 +40,11 @@ class VideoAsset(MediaAsset):
         self.end: Union[int, None] = end
 
     def to_json(self) -> dict:
-        return copy.deepcopy(self.__dict__)
+        return {
+            "asset_id": self.asset_id,
+            "start": self.start,
+            "end": self.end,
+        }
 
     def __repr__(self) -> str:
         return (
@@ -74,7 +77,14 @@ class AudioAsset(MediaAsset):
         )
 
     def to_json(self) -> dict:
-        return copy.deepcopy(self.__dict__)
+        return {
+            "asset_id": self.asset_id,
+            "start": self.start,
+            "end": self.end,
+            "disable_other_tracks": self.disable_other_tracks,
+            "fade_in_duration": self.fade_in_duration,
+            "fade_out_duration": self.fade_out_duration,
+        }
 
     def __repr__(self) -> str:
         return (
@@ -106,7 +116,14 @@ class ImageAsset(MediaAsset):
         self.duration = duration
 
     def to_json(self) -> dict:
-        return copy.deepcopy(self.__dict__)
+        return {
+            "asset_id": self.asset_id,
+            "width": self.width,
+            "height": self.height,
+            "x": self.x,
+            "y": self.y,
+            "duration": self.duration,
+        }
 
     def __repr__(self) -> str:
         return (
@@ -134,10 +151,10 @@ class TextAsset(MediaAsset):
 
     def to_json(self) -> dict:
         return {
-            "text": copy.deepcopy(self.text),
-            "asset_id": copy.deepcopy(self.asset_id),
-            "duration": copy.deepcopy(self.duration),
-            "style": copy.deepcopy(self.style.__dict__),
+            "text": self.text,
+            "asset_id": self.asset_id,
+            "duration": self.duration,
+            "style": dict(self.style.__dict__),
         }
 
     def __repr__(self) -> str:
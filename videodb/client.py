@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from typing import (
@@ -8,10 +9,12 @@ from typing import (
 from videodb.__about__ import __version__
 from videodb._constants import (
     ApiPath,
+    UploadDefaultValues,
 )
 
 from videodb.collection import Collection
 from videodb._utils._http_client import HttpClient
+from videodb._utils._async_http_client import AsyncHttpClient
 from videodb.video import Video
 from videodb.audio import Audio
 from videodb.image import Image
@@ -41,8 +44,50 @@ class Connection(HttpClient):
         self.api_key = api_key
         self.base_url = base_url
         self.collection_id = "default"
+        self._async_client = None
+        self._async_client_loop = None
         super().__init__(api_key=api_key, base_url=base_url, version=__version__)
 
+    @property
+    def async_client(self) -> AsyncHttpClient:
+        """Async http client sharing this connection's credentials.
+
+        Pooled connections belong to the event loop that opened them, so a new
+        client is created whenever this is accessed from a different running loop.
+
+        :raise ImportError: If httpx is not installed
+        :raise RuntimeError: If accessed outside a running event loop
+        :return: :class:`AsyncHttpClient <AsyncHttpClient>` object
+        :rtype: :class:`videodb._utils._async_http_client.AsyncHttpClient`
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncHttpClient(
+                api_key=self.api_key, base_url=self.base_url, version=__version__
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async http client of the running event loop, if any.
+
+        :return: None
+        :rtype: None
+        """
+        if (
+            self._async_client is not None
+            and self._async_client_loop is asyncio.get_running_loop()
+        ):
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def __aenter__(self) -> "Connection":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     def get_collection(self, collection_id: Optional[str] = "default") -> Collection:
         """Get a collection object by its ID.
 
@@ -171,6 +216,8 @@ class Connection(HttpClient):
         name: Optional[str] = None,
         description: Optional[str] = None,
         callback_url: Optional[str] = None,
+        chunk_size: int = UploadDefaultValues.chunk_size,
+        parallelism: int = UploadDefaultValues.parallelism,
     ) -> Union[Video, Audio, Image, None]:
         """Upload a file.
 
@@ -180,6 +227,8 @@ class Connection(HttpClient):
         :param str name: Name of the file (optional)
         :param str description: Description of the file (optional)
         :param str callback_url: URL to receive the callback (optional)
+        :param int chunk_size: Size in bytes of each part for multipart uploads of large files (optional)
+        :param int parallelism: Number of parts uploaded concurrently for large files (optional)
         :return: :class:`Video <Video>`, or :class:`Audio <Audio>`, or :class:`Image <Image>` object
         :rtype: Union[ :class:`videodb.video.Video`, :class:`videodb.audio.Audio`, :class:`videodb.image.Image`]
         """
@@ -191,6 +240,8 @@ class Connection(HttpClient):
             name,
             description,
             callback_url,
+            chunk_size,
+            parallelism,
         )
         media_id = upload_data.get("id", "")
         if media_id.startswith("m-"):
@@ -12,6 +12,7 @@ from videodb._upload import (
 )
 from videodb._constants import (
     ApiPath,
+    UploadDefaultValues,
     IndexType,
     SearchType,
 )
@@ -225,6 +226,8 @@ class Collection:
         name: Optional[str] = None,
         description: Optional[str] = None,
         callback_url: Optional[str] = None,
+        chunk_size: int = UploadDefaultValues.chunk_size,
+        parallelism: int = UploadDefaultValues.parallelism,
     ) -> Union[Video, Audio, Image, None]:
         """Upload a file to the collection.
 
@@ -234,6 +237,8 @@ class Collection:
         :param str name: Name of the file (optional)
         :param str description: Description of the file (optional)
         :param str callback_url: URL to receive the callback (optional)
+        :param int chunk_size: Size in bytes of each part for multipart uploads of large files (optional)
+        :param int parallelism: Number of parts uploaded concurrently for large files (optional)
         :return: :class:`Video <Video>`, or :class:`Audio <Audio>`, or :class:`Image <Image>` object
         :rtype: Union[ :class:`videodb.video.Video`, :class:`videodb.audio.Audio`, :class:`videodb.image.Image`]
         """
@@ -245,6 +250,8 @@ class Collection:
             name,
             description,
             callback_url,
+            chunk_size,
+            parallelism,
         )
         media_id = upload_data.get("id", "")
         if media_id.startswith("m-"):
@@ -12,6 +12,8 @@ class Image:
     :ivar str url: URL of the image
     """
 
+    __slots__ = ("_connection", "id", "collection_id", "name", "url")
+
     def __init__(self, _connection, id: str, collection_id: str, **kwargs) -> None:
         self._connection = _connection
         self.id = id
@@ -62,6 +64,8 @@ class Frame(Image):
     :ivar str description: Description of the frame contents
     """
 
+    __slots__ = ("scene_id", "video_id", "frame_time", "description")
+
     def __init__(
         self,
         _connection,
@@ -31,6 +31,24 @@ class Video:
     :ivar list scenes: List of scenes in the video
     """
 
+    __slots__ = (
+        "_connection",
+        "id",
+        "collection_id",
+        "stream_url",
+        "player_url",
+        "name",
+        "description",
+        "thumbnail_url",
+        "length",
+        "transcript",
+        "transcript_text",
+        "_transcript_text_is_full",
+        "scenes",
+        "_search_cache",
+        "_base",
+    )
+
     def __init__(self, _connection, id: str, collection_id: str, **kwargs) -> None:
         self._connection = _connection
         self.id = id
@@ -43,7 +61,10 @@ class Video:
         self.length = float(kwargs.get("length", 0.0))
         self.transcript = kwargs.get("transcript", None)
         self.transcript_text = kwargs.get("transcript_text", None)
+        self._transcript_text_is_full = self.transcript_text is not None
         self.scenes = kwargs.get("scenes", None)
+        self._search_cache = {}
+        self._base = f"{ApiPath.video}/{id}"
 
     def __repr__(self) -> str:
         return (
@@ -59,7 +80,9 @@ class Video:
         )
 
     def __getitem__(self, key):
-        return self.__dict__[key]
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
 
     def search(
         self,
@@ -84,7 +107,10 @@ class Video:
         :return: :class:`SearchResult <SearchResult>` object
         :rtype: :class:`videodb.search.SearchResult`
         """
-        search = SearchFactory(self._connection).get_search(search_type)
+        search = self._search_cache.get(search_type)
+        if search is None:
+            search = SearchFactory(self._connection).get_search(search_type)
+            self._search_cache[search_type] = search
         return search.search_inside_video(
             video_id=self.id,
             query=query,
@@ -104,7 +130,7 @@ class Video:
         :return: None if the delete is successful
         :rtype: None
         """
-        self._connection.delete(path=f"{ApiPath.video}/{self.id}")
+        self._connection.delete(path=self._base)
 
     def remove_storage(self) -> None:
         """Remove the video storage.
@@ -113,7 +139,7 @@ class Video:
         :return: None if the removal is successful
         :rtype: None
         """
-        self._connection.delete(path=f"{ApiPath.video}/{self.id}/{ApiPath.storage}")
+        self._connection.delete(path=f"{self._base}/{ApiPath.storage}")
 
     def generate_stream(
         self, timeline: Optional[List[Tuple[float, float]]] = None
@@ -129,7 +155,7 @@ class Video:
             return self.stream_url
 
         stream_data = self._connection.post(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.stream}",
+            path=f"{self._base}/{ApiPath.stream}",
             data={
                 "timeline": timeline,
                 "length": self.length,
@@ -149,16 +175,14 @@ class Video:
 
         if time:
             thumbnail_data = self._connection.post(
-                path=f"{ApiPath.video}/{self.id}/{ApiPath.thumbnail}",
+                path=f"{self._base}/{ApiPath.thumbnail}",
                 data={
                     "time": time,
                 },
             )
             return Image(self._connection, **thumbnail_data)
 
-        thumbnail_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.thumbnail}"
-        )
+        thumbnail_data = self._connection.get(path=f"{self._base}/{ApiPath.thumbnail}")
         self.thumbnail_url = thumbnail_data.get("thumbnail_url")
         return self.thumbnail_url
 
@@ -169,7 +193,7 @@ class Video:
         :rtype: List[:class:`videodb.image.Image`]
         """
         thumbnails_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.thumbnails}"
+            path=f"{self._base}/{ApiPath.thumbnails}"
         )
         return [Image(self._connection, **thumbnail) for thumbnail in thumbnails_data]
 
@@ -180,29 +204,65 @@ class Video:
         segmenter: str = Segmenter.word,
         length: int = 1,
         force: bool = None,
+        show_progress: bool = False,
     ) -> None:
-        if (
+        if self._has_transcript(start, end, segmenter, length, force):
+            return
+        transcript_data = self._connection.get(
+            path=f"{self._base}/{ApiPath.transcription}",
+            params=self._transcript_params(start, end, segmenter, length, force),
+            show_progress=show_progress,
+        )
+        self._set_transcript(transcript_data, start, end)
+
+    async def _fetch_transcript_async(
+        self,
+        start: int = None,
+        end: int = None,
+        segmenter: str = Segmenter.word,
+        length: int = 1,
+        force: bool = None,
+    ) -> None:
+        if self._has_transcript(start, end, segmenter, length, force):
+            return
+        transcript_data = await self._connection.async_client.get(
+            path=f"{self._base}/{ApiPath.transcription}",
+            params=self._transcript_params(start, end, segmenter, length, force),
+        )
+        self._set_transcript(transcript_data, start, end)
+
+    def _set_transcript(self, transcript_data: dict, start, end) -> None:
+        self.transcript = transcript_data.get("word_timestamps", [])
+        self.transcript_text = transcript_data.get("text", "")
+        self._transcript_text_is_full = not start and not end
+
+    def _has_transcript(self, start, end, segmenter, length, force) -> bool:
+        return bool(
             self.transcript
             and not start
             and not end
             and not segmenter
             and not length
             and not force
-        ):
-            return
-        transcript_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.transcription}",
-            params={
-                "start": start,
-                "end": end,
-                "segmenter": segmenter,
-                "length": length,
-                "force": "true" if force else "false",
-            },
-            show_progress=True,
         )
-        self.transcript = transcript_data.get("word_timestamps", [])
-        self.transcript_text = transcript_data.get("text", "")
+
+    def _has_transcript_text(self, start, end, force) -> bool:
+        return bool(
+            self.transcript_text
+            and self._transcript_text_is_full
+            and not start
+            and not end
+            and not force
+        )
+
+    def _transcript_params(self, start, end, segmenter, length, force) -> dict:
+        return {
+            "start": start,
+            "end": end,
+            "segmenter": segmenter,
+            "length": length,
+            "force": "true" if force else "false",
+        }
 
     def get_transcript(
         self,
@@ -211,6 +271,7 @@ class Video:
         segmenter: Segmenter = Segmenter.word,
         length: int = 1,
         force: bool = None,
+        show_progress: bool = False,
     ) -> List[Dict[str, Union[float, str]]]:
         """Get timestamped transcript segments for the video.
 
@@ -220,11 +281,17 @@ class Video:
             :class:`Segmenter.sentence`, :class:`Segmenter.time`)
         :param int length: Length of segments when using time segmenter
         :param bool force: Force fetch new transcript
+        :param bool show_progress: (optional) Show a progress bar while the transcript is generated
         :return: List of dicts with keys: start (float), end (float), text (str)
         :rtype: List[Dict[str, Union[float, str]]]
         """
         self._fetch_transcript(
-            start=start, end=end, segmenter=segmenter, length=length, force=force
+            start=start,
+            end=end,
+            segmenter=segmenter,
+            length=length,
+            force=force,
+            show_progress=show_progress,
         )
         return self.transcript
 
@@ -235,16 +302,68 @@ class Video:
         segmenter: str = Segmenter.word,
         length: int = 1,
         force: bool = None,
+        show_progress: bool = False,
     ) -> str:
         """Get plain text transcript for the video.
 
         :param int start: Start time in seconds to get transcript from
         :param int end: End time in seconds to get transcript until
         :param bool force: Force fetch new transcript
+        :param bool show_progress: (optional) Show a progress bar while the transcript is generated
         :return: Full transcript text as string
         :rtype: str
         """
+        if self._has_transcript_text(start, end, force):
+            return self.transcript_text
         self._fetch_transcript(
+            start=start,
+            end=end,
+            segmenter=segmenter,
+            length=length,
+            force=force,
+            show_progress=show_progress,
+        )
+        return self.transcript_text
+
+    async def get_transcript_async(
+        self,
+        start: int = None,
+        end: int = None,
+        segmenter: Segmenter = Segmenter.word,
+        length: int = 1,
+        force: bool = None,
+    ) -> List[Dict[str, Union[float, str]]]:
+        """Coroutine version of :meth:`get_transcript <Video.get_transcript>`,
+        takes the same parameters.
+
+        Requests go through :attr:`Connection.async_client <videodb.client.Connection.async_client>`,
+        so transcripts of many videos can be fetched concurrently with :func:`asyncio.gather`.
+
+        :return: List of dicts with keys: start (float), end (float), text (str)
+        :rtype: List[Dict[str, Union[float, str]]]
+        """
+        await self._fetch_transcript_async(
+            start=start, end=end, segmenter=segmenter, length=length, force=force
+        )
+        return self.transcript
+
+    async def get_transcript_text_async(
+        self,
+        start: int = None,
+        end: int = None,
+        segmenter: str = Segmenter.word,
+        length: int = 1,
+        force: bool = None,
+    ) -> str:
+        """Coroutine version of :meth:`get_transcript_text <Video.get_transcript_text>`,
+        takes the same parameters.
+
+        :return: Full transcript text as string
+        :rtype: str
+        """
+        if self._has_transcript_text(start, end, force):
+            return self.transcript_text
+        await self._fetch_transcript_async(
             start=start, end=end, segmenter=segmenter, length=length, force=force
         )
         return self.transcript_text
@@ -254,25 +373,27 @@ class Video:
         language_code: Optional[str] = None,
         force: bool = False,
         callback_url: str = None,
+        show_progress: bool = False,
     ) -> None:
         """Semantic indexing of spoken words in the video.
 
         :param str language_code: (optional) Language code of the video
         :param bool force: (optional) Force to index the video
         :param str callback_url: (optional) URL to receive the callback
+        :param bool show_progress: (optional) Show a progress bar while the video is indexed
         :raises InvalidRequestError: If the video is already indexed
         :return: None if the indexing is successful
         :rtype: None
         """
         self._connection.post(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}",
+            path=f"{self._base}/{ApiPath.index}",
             data={
                 "index_type": IndexType.spoken_word,
                 "language_code": language_code,
                 "force": force,
                 "callback_url": callback_url,
             },
-            show_progress=True,
+            show_progress=show_progress,
         )
 
     def get_scenes(self) -> Union[list, None]:
@@ -288,7 +409,7 @@ class Video:
         if self.scenes:
             return self.scenes
         scene_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}",
+            path=f"{self._base}/{ApiPath.index}",
             params={
                 "index_type": IndexType.scene,
             },
@@ -297,31 +418,30 @@ class Video:
         return scene_data if scene_data else None
 
     def _format_scene_collection(self, scene_collection_data: dict) -> SceneCollection:
-        scenes = []
-        for scene in scene_collection_data.get("scenes", []):
-            frames = []
-            for frame in scene.get("frames", []):
-                frame = Frame(
-                    self._connection,
-                    frame.get("frame_id"),
-                    self.id,
-                    scene.get("scene_id"),
-                    frame.get("url"),
-                    frame.get("frame_time"),
-                    frame.get("description"),
-                )
-                frames.append(frame)
-            scene = Scene(
+        scenes = [
+            Scene(
                 video_id=self.id,
                 start=scene.get("start"),
                 end=scene.get("end"),
                 description=scene.get("description"),
                 id=scene.get("scene_id"),
-                frames=frames,
+                frames=[
+                    Frame(
+                        self._connection,
+                        frame.get("frame_id"),
+                        self.id,
+                        scene.get("scene_id"),
+                        frame.get("url"),
+                        frame.get("frame_time"),
+                        frame.get("description"),
+                    )
+                    for frame in scene.get("frames", [])
+                ],
                 metadata=scene.get("metadata", {}),
                 connection=self._connection,
             )
-            scenes.append(scene)
+            for scene in scene_collection_data.get("scenes", [])
+        ]
 
         return SceneCollection(
             self._connection,
@@ -331,6 +451,21 @@ class Video:
             scenes,
         )
 
+    def _extract_scenes_data(
+        self, extraction_type, extraction_config, force, callback_url
+    ) -> dict:
+        return {
+            "extraction_type": extraction_type,
+            "extraction_config": extraction_config,
+            "force": force,
+            "callback_url": callback_url,
+        }
+
+    def _scene_collection_from(self, scenes_data) -> Optional[SceneCollection]:
+        if not scenes_data:
+            return None
+        return self._format_scene_collection(scenes_data.get("scene_collection"))
+
     def extract_scenes(
         self,
         extraction_type: SceneExtractionType = SceneExtractionType.shot_based,
@@ -364,17 +499,33 @@ class Video:
         :rtype: :class:`videodb.scene.SceneCollection`
         """
         scenes_data = self._connection.post(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.scenes}",
-            data={
-                "extraction_type": extraction_type,
-                "extraction_config": extraction_config,
-                "force": force,
-                "callback_url": callback_url,
-            },
+            path=f"{self._base}/{ApiPath.scenes}",
+            data=self._extract_scenes_data(
+                extraction_type, extraction_config, force, callback_url
+            ),
         )
-        if not scenes_data:
-            return None
-        return self._format_scene_collection(scenes_data.get("scene_collection"))
+        return self._scene_collection_from(scenes_data)
+
+    async def extract_scenes_async(
+        self,
+        extraction_type: SceneExtractionType = SceneExtractionType.shot_based,
+        extraction_config: dict = {},
+        force: bool = False,
+        callback_url: str = None,
+    ) -> Optional[SceneCollection]:
+        """Coroutine version of :meth:`extract_scenes <Video.extract_scenes>`,
+        takes the same parameters.
+
+        :return: The scene collection, :class:`SceneCollection <SceneCollection>` object
+        :rtype: :class:`videodb.scene.SceneCollection`
+        """
+        scenes_data = await self._connection.async_client.post(
+            path=f"{self._base}/{ApiPath.scenes}",
+            data=self._extract_scenes_data(
+                extraction_type, extraction_config, force, callback_url
+            ),
+        )
+        return self._scene_collection_from(scenes_data)
 
     def get_scene_collection(self, collection_id: str) -> Optional[SceneCollection]:
         """Get the scene collection.
@@ -386,7 +537,7 @@ class Video:
         if not collection_id:
             raise ValueError("collection_id is required")
         scenes_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.scenes}/{collection_id}",
+            path=f"{self._base}/{ApiPath.scenes}/{collection_id}",
             params={"collection_id": self.collection_id},
         )
         if not scenes_data:
@@ -400,7 +551,7 @@ class Video:
         :rtype: list
         """
         scene_collections_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.scenes}",
+            path=f"{self._base}/{ApiPath.scenes}",
             params={"collection_id": self.collection_id},
         )
         return scene_collections_data.get("scene_collections", [])
@@ -415,9 +566,36 @@ class Video:
         """
         if not collection_id:
             raise ValueError("collection_id is required")
-        self._connection.delete(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.scenes}/{collection_id}"
-        )
+        self._connection.delete(path=f"{self._base}/{ApiPath.scenes}/{collection_id}")
+
+    def _index_scenes_data(
+        self,
+        extraction_type,
+        extraction_config,
+        prompt,
+        metadata,
+        model_name,
+        model_config,
+        name,
+        scenes,
+        callback_url,
+    ) -> dict:
+        return {
+            "extraction_type": extraction_type,
+            "extraction_config": extraction_config,
+            "prompt": prompt,
+            "metadata": metadata,
+            "model_name": model_name,
+            "model_config": model_config,
+            "name": name,
+            "scenes": [scene.to_json() for scene in scenes] if scenes else None,
+            "callback_url": callback_url,
+        }
+
+    def _scene_index_id(self, scenes_data) -> Optional[str]:
+        if not scenes_data:
+            return None
+        return scenes_data.get("scene_index_id")
 
     def index_scenes(
         self,
@@ -461,22 +639,54 @@ class Video:
         :rtype: str
         """
         scenes_data = self._connection.post(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}/{ApiPath.scene}",
-            data={
-                "extraction_type": extraction_type,
-                "extraction_config": extraction_config,
-                "prompt": prompt,
-                "metadata": metadata,
-                "model_name": model_name,
-                "model_config": model_config,
-                "name": name,
-                "scenes": [scene.to_json() for scene in scenes] if scenes else None,
-                "callback_url": callback_url,
-            },
+            path=f"{self._base}/{ApiPath.index}/{ApiPath.scene}",
+            data=self._index_scenes_data(
+                extraction_type,
+                extraction_config,
+                prompt,
+                metadata,
+                model_name,
+                model_config,
+                name,
+                scenes,
+                callback_url,
+            ),
         )
-        if not scenes_data:
-            return None
-        return scenes_data.get("scene_index_id")
+        return self._scene_index_id(scenes_data)
+
+    async def index_scenes_async(
+        self,
+        extraction_type: SceneExtractionType = SceneExtractionType.shot_based,
+        extraction_config: Dict = {},
+        prompt: Optional[str] = None,
+        metadata: Dict = {},
+        model_name: Optional[str] = None,
+        model_config: Optional[Dict] = None,
+        name: Optional[str] = None,
+        scenes: Optional[List[Scene]] = None,
+        callback_url: Optional[str] = None,
+    ) -> Optional[str]:
+        """Coroutine version of :meth:`index_scenes <Video.index_scenes>`,
+        takes the same parameters.
+
+        :return: The scene index id
+        :rtype: str
+        """
+        scenes_data = await self._connection.async_client.post(
+            path=f"{self._base}/{ApiPath.index}/{ApiPath.scene}",
+            data=self._index_scenes_data(
+                extraction_type,
+                extraction_config,
+                prompt,
+                metadata,
+                model_name,
+                model_config,
+                name,
+                scenes,
+                callback_url,
+            ),
+        )
+        return self._scene_index_id(scenes_data)
 
     def list_scene_index(self) -> List:
         """List all the scene indexes.
@@ -485,7 +695,7 @@ class Video:
         :rtype: list
         """
         index_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}/{ApiPath.scene}",
+            path=f"{self._base}/{ApiPath.index}/{ApiPath.scene}",
             params={"collection_id": self.collection_id},
         )
         return index_data.get("scene_indexes", [])
@@ -498,7 +708,7 @@ class Video:
         :rtype: list
         """
         index_data = self._connection.get(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}/{ApiPath.scene}/{scene_index_id}",
+            path=f"{self._base}/{ApiPath.index}/{ApiPath.scene}/{scene_index_id}",
             params={"collection_id": self.collection_id},
         )
         if not index_data:
@@ -516,7 +726,7 @@ class Video:
         if not scene_index_id:
             raise ValueError("scene_index_id is required")
         self._connection.delete(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.index}/{ApiPath.scene}/{scene_index_id}"
+            path=f"{self._base}/{ApiPath.index}/{ApiPath.scene}/{scene_index_id}"
         )
 
     def add_subtitle(self, style: SubtitleStyle = SubtitleStyle()) -> str:
@@ -529,7 +739,7 @@ class Video:
         if not isinstance(style, SubtitleStyle):
             raise ValueError("style must be of type SubtitleStyle")
         subtitle_data = self._connection.post(
-            path=f"{ApiPath.video}/{self.id}/{ApiPath.workflow}",
+            path=f"{self._base}/{ApiPath.workflow}",
             data={
                 "type": Workflows.add_subtitles,
                 "subtitle_style": style.__dict__,